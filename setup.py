@@ -1,4 +1,5 @@
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 import os
 
 # Read README for long description
@@ -9,6 +10,17 @@ def read_readme():
             return f.read()
     return ""
 
+
+class build_py_with_version(build_py):
+    """Write winter/_version.py into the build so the version needs no lookup at runtime."""
+    
+    def run(self):
+        super().run()
+        if not self.dry_run:
+            version_path = os.path.join(self.build_lib, "winter", "_version.py")
+            with open(version_path, "w", encoding="utf-8") as f:
+                f.write(f'__version__ = "{self.distribution.get_version()}"\n')
+
 setup(
     name="winter-snowflake",
     version="0.1.1",
@@ -64,6 +76,7 @@ setup(
     ],
     keywords="snowflake database terminal client cli sql query management",
     include_package_data=True,
+    cmdclass={"build_py": build_py_with_version},
     zip_safe=False,
     extras_require={
         "dev": [
@@ -0,0 +1,115 @@
+"""
+Tests for SnowflakeClient metadata caching.
+"""
+
+import types
+
+import pytest
+
+import winter.snowflake as winter_snowflake
+from winter.snowflake import SnowflakeClient
+
+
+class FakeCursor:
+    """Cursor that records executed queries on its connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = [('name',)]
+
+    def execute(self, query):
+        self.connection.executed.append(query)
+        if query.upper().startswith('USE DATABASE'):
+            self.connection.database = query.split()[-1]
+
+    def fetchall(self):
+        return [(f"row{len(self.connection.executed)}",)]
+
+    def fetchone(self):
+        return ('1',)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Connection exposing the session context attributes the cache keys on."""
+
+    def __init__(self):
+        self.executed = []
+        self.database = 'DB'
+        self.schema = 'PUBLIC'
+        self.role = 'ROLE'
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A quiet client connected to a fake Snowflake session."""
+    monkeypatch.setattr(winter_snowflake, '_sf', lambda: types.SimpleNamespace(connect=lambda **kwargs: FakeConnection()))
+    config = {
+        'account': 'acct', 'user': 'user', 'warehouse': 'wh', 'database': 'DB',
+        'schema': 'PUBLIC', 'role': 'ROLE', 'auth_method': 'password', 'password': 'secret',
+    }
+    client = SnowflakeClient(config, quiet=True)
+    client.connect()
+    client.connection.executed.clear()
+    return client
+
+
+def test_object_listing_queries_are_cached(client):
+    """Test that repeated SHOW TABLES is answered from the cache."""
+    first = client.execute_query_with_columns('SHOW TABLES')
+    second = client.execute_query_with_columns('SHOW   TABLES')
+
+    assert second == first
+    assert client.connection.executed == ['SHOW TABLES']
+
+
+@pytest.mark.parametrize('query', ['SHOW VARIABLES', 'SHOW TRANSACTIONS', 'DESC RESULT LAST_QUERY_ID()'])
+def test_session_state_queries_are_not_cached(client, query):
+    """Test that SHOW/DESC commands outside the allowlist always run."""
+    client.execute_query_with_columns(query)
+    client.execute_query_with_columns(query)
+
+    assert client.connection.executed == [query, query]
+
+
+def test_cache_expires_after_ttl(client, monkeypatch):
+    """Test that cached results older than the TTL are fetched again."""
+    now = [1000.0]
+    monkeypatch.setattr(winter_snowflake.time, 'monotonic', lambda: now[0])
+
+    client.execute_query_with_columns('SHOW TABLES')
+    now[0] += winter_snowflake.METADATA_CACHE_TTL + 1
+    client.execute_query_with_columns('SHOW TABLES')
+
+    assert client.connection.executed == ['SHOW TABLES', 'SHOW TABLES']
+
+
+@pytest.mark.parametrize('statement', ['SET x = 1', 'INSERT INTO t VALUES (1)', 'TRUNCATE TABLE t', 'USE DATABASE OTHER'])
+def test_cache_is_cleared_by_state_changes(client, statement):
+    """Test that SET, DML and USE statements invalidate cached metadata."""
+    client.execute_query_with_columns('SHOW TABLES')
+    client.execute_query(statement)
+    client.execute_query_with_columns('SHOW TABLES')
+
+    assert client.connection.executed == ['SHOW TABLES', statement, 'SHOW TABLES']
+
+
+def test_cached_results_are_not_aliased(client):
+    """Test that mutating a returned result doesn't change later cache hits."""
+    columns, results = client.execute_query_with_columns('SHOW TABLES')
+    expected = list(results)
+    results.append('junk')
+    columns.append('junk')
+
+    cached_columns, cached_results = client.execute_query_with_columns('SHOW TABLES')
+    cached_results.append('more junk')
+
+    assert client.execute_query_with_columns('SHOW TABLES') == (['name'], expected)
@@ -1176,22 +1176,22 @@ def package_info():
         
         # Tampilkan informasi dasar
         console.print(Panel.fit(
-            f"Package: {info['name']}\n"
-            f"Version: {info['version']}\n"
-            f"Location: {info['location'] or 'Development mode'}\n"
-            f"Status: {'Installed' if info['installed'] else 'Development mode'}",
+            f"Package: {info.name}\n"
+            f"Version: {info.version}\n"
+            f"Location: {info.location or 'Development mode'}\n"
+            f"Status: {'Installed' if info.installed else 'Development mode'}",
             title="Winter Package Info",
             border_style="blue"
         ))
         
         # Tampilkan dependencies jika ada
-        if info['requires']:
+        if info.requires:
             console.print("\n📦 Dependencies:")
             table = Table(show_header=True, header_style="bold green")
             table.add_column("Package", style="cyan")
             table.add_column("Version", style="magenta")
             
-            for req in info['requires']:
+            for req in info.requires:
                 # Parse requirement string
                 if '==' in req:
                     pkg, ver = req.split('==', 1)
@@ -2,82 +2,109 @@
 Snowflake connection and query execution.
 """
 
-import snowflake.connector
+import functools
+import threading
 import time
 import logging
 import getpass
-from cryptography.hazmat.primitives import serialization
-from typing import Dict, Any, List, Optional, Tuple
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from collections import OrderedDict
+from contextlib import ExitStack, closing, contextmanager
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-console = Console()
+if TYPE_CHECKING:
+    import asyncio
+    import snowflake.connector
+
+# asyncio, snowflake.connector, cryptography and rich are imported on first use so
+# that CLI commands which never open a connection don't pay for them at startup.
+_console = None
 logger = logging.getLogger(__name__)
 
+# Object-listing queries (schema browsing, completion) are cached briefly per client.
+# Only these are cached: other SHOW/DESC commands (variables, transactions, locks,
+# warehouses, DESC RESULT) report session or server state that changes on its own.
+METADATA_QUERY_PREFIXES = (
+    ('SHOW', 'TABLES'), ('SHOW', 'VIEWS'), ('SHOW', 'SCHEMAS'), ('SHOW', 'DATABASES'), ('SHOW', 'COLUMNS'),
+    ('DESCRIBE', 'TABLE'), ('DESCRIBE', 'VIEW'), ('DESC', 'TABLE'), ('DESC', 'VIEW'),
+)
+# Statements that change the session context, session variables, or the objects
+# and row counts metadata queries list
+METADATA_INVALIDATING_PREFIXES = (
+    'USE', 'SET', 'UNSET', 'CREATE', 'ALTER', 'DROP', 'UNDROP', 'RENAME', 'GRANT', 'REVOKE',
+    'TRUNCATE', 'INSERT', 'DELETE', 'MERGE', 'UPDATE', 'COPY',
+)
+METADATA_CACHE_SIZE = 128
+METADATA_CACHE_TTL = 60  # seconds
+
+
+@functools.lru_cache(maxsize=None)
+def _sf():
+    """Import and return the snowflake.connector module."""
+    import snowflake.connector
+    return snowflake.connector
+
+
+def _print(*args, **kwargs):
+    """Print through a shared Rich console created on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    _console.print(*args, **kwargs)
+
+
+async def _run_in_thread(func, *args, **kwargs):
+    """Run a blocking call in the default executor (asyncio.to_thread for Python 3.8)."""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
 
 class SnowflakeClient:
     """Snowflake client for connection and query execution."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], quiet: bool = False):
         self.config = config
+        self.quiet = quiet  # Suppress status output for programmatic callers
         self.connection = None
         self.is_connected = False
         self.connection_pool = []
         self.max_pool_size = 5
+        self.min_pool_size = config.get('min_pool_size', 0)  # Extra sessions opened on the first async query
+        self._pool_warmed = False
+        self._pool_lock = threading.Lock()
+        self._active_checkouts = 0
+        self._query_semaphore = None
+        self._query_semaphore_loop = None
+        self._metadata_cache = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
         self.last_activity = None
         self.connection_timeout = config.get('connection_timeout', 5)  # 5 minutes default
     
-    def connect(self, retry_count: int = 3, retry_delay: int = 2) -> snowflake.connector.SnowflakeConnection:
+    def _log(self, message: str):
+        """Print a status message unless the client is quiet."""
+        if not self.quiet:
+            _print(message)
+    
+    def _query_preview(self, query: str) -> str:
+        """Shorten a query for status output."""
+        return f"{query[:50]}{'...' if len(query) > 50 else ''}"
+    
+    def connect(self, retry_count: int = 3, retry_delay: int = 2) -> "snowflake.connector.SnowflakeConnection":
         """Establish connection to Snowflake with retry mechanism."""
         for attempt in range(retry_count):
             try:
-                console.print(f"🔌 Connecting to Snowflake (attempt {attempt + 1}/{retry_count})...")
-                
-                # Normalize account format
-                normalized_account = self._normalize_account(self.config['account'])
-                
-                # Prepare connection parameters based on authentication method
-                connection_params = {
-                    'account': normalized_account,
-                    'user': self.config['user'],
-                    'warehouse': self.config['warehouse'],
-                    'database': self.config['database'],
-                    'schema': self.config['schema'],
-                    'role': self.config['role'],
-                    # Connection options for better stability
-                    'timeout': 30,
-                    'login_timeout': 30,
-                    'insecure_mode': True,  # Disable SSL certificate validation
-                    'network_timeout': self.connection_timeout * 60,  # Convert minutes to seconds
-                    'query_timeout': 0,  # Unlimited query timeout
-                    # Application identification
-                    'application': 'Winter-Terminal-Client'
-                }
+                self._log(f"🔌 Connecting to Snowflake (attempt {attempt + 1}/{retry_count})...")
                 
-                # Add authentication based on method
-                auth_method = self.config.get('auth_method', 'keypair')
-                
-                if auth_method == 'keypair':
-                    # Load private key for keypair authentication
-                    private_key = self._load_private_key()
-                    connection_params['private_key'] = private_key
-                elif auth_method == 'password':
-                    # Use password authentication
-                    password = self.config.get('password')
-                    if password is None:
-                        # Prompt for password if not stored
-                        password = getpass.getpass("Password: ")
-                    connection_params['password'] = password
-                else:
-                    raise ValueError(f"Invalid auth_method: {auth_method}")
+                connection_params = self._build_connection_params()
                 
                 # Establish connection
-                self.connection = snowflake.connector.connect(**connection_params)
+                self.connection = self._open_connection(connection_params)
                 
                 self.is_connected = True
                 self.last_activity = time.time()
-                console.print("✅ Successfully connected to Snowflake!")
+                self._log("✅ Successfully connected to Snowflake!")
                 
                 # Test connection with simple query
                 self._test_connection()
@@ -85,16 +112,77 @@ class SnowflakeClient:
                 return self.connection
                 
             except Exception as e:
-                console.print(f"❌ Connection attempt {attempt + 1} failed: {e}")
+                self._log(f"❌ Connection attempt {attempt + 1} failed: {e}")
                 
                 if attempt < retry_count - 1:
-                    console.print(f"⏳ Retrying in {retry_delay} seconds...")
+                    self._log(f"⏳ Retrying in {retry_delay} seconds...")
                     time.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
                 else:
-                    console.print("❌ All connection attempts failed")
+                    self._log("❌ All connection attempts failed")
                     raise ConnectionError(f"Failed to connect to Snowflake after {retry_count} attempts: {e}")
     
+    def _build_connection_params(self) -> Dict[str, Any]:
+        """Build connector keyword arguments from config."""
+        # Normalize account format
+        normalized_account = self._normalize_account(self.config['account'])
+        
+        # Prepare connection parameters based on authentication method
+        connection_params = {
+            'account': normalized_account,
+            'user': self.config['user'],
+            'warehouse': self.config['warehouse'],
+            'database': self.config['database'],
+            'schema': self.config['schema'],
+            'role': self.config['role'],
+            # Connection options for better stability
+            'timeout': 30,
+            'login_timeout': 30,
+            'insecure_mode': True,  # Disable SSL certificate validation
+            'network_timeout': self.connection_timeout * 60,  # Convert minutes to seconds
+            'query_timeout': 0,  # Unlimited query timeout
+            # Let the connector heartbeat in the background instead of pinging per query
+            'client_session_keep_alive': True,
+            'client_session_keep_alive_heartbeat_frequency': 900,  # Seconds (connector minimum)
+            # Application identification
+            'application': 'Winter-Terminal-Client'
+        }
+        
+        # Add authentication based on method
+        auth_method = self.config.get('auth_method', 'keypair')
+        
+        if auth_method == 'keypair':
+            # Load private key for keypair authentication
+            private_key = self._load_private_key()
+            connection_params['private_key'] = private_key
+        elif auth_method == 'password':
+            # Use password authentication
+            password = self.config.get('password')
+            if password is None:
+                # Prompt for password if not stored
+                password = getpass.getpass("Password: ")
+            connection_params['password'] = password
+        else:
+            raise ValueError(f"Invalid auth_method: {auth_method}")
+        
+        return connection_params
+    
+    def _open_connection(self, connection_params: Dict[str, Any]):
+        """Open a connector connection with a dedicated cursor for liveness pings."""
+        connection = _sf().connect(**connection_params)
+        connection._winter_ping_cursor = connection.cursor()
+        connection._winter_ping_lock = threading.Lock()  # A cursor isn't thread-safe
+        return connection
+    
+    def _ping(self, connection) -> bool:
+        """Run SELECT 1 on the connection's ping cursor without fetching."""
+        with connection._winter_ping_lock:
+            try:
+                connection._winter_ping_cursor.execute("SELECT 1")
+                return True
+            except Exception:
+                return False
+    
     def _normalize_account(self, account: str) -> str:
         """Normalize account format for Snowflake connection."""
         if not account:
@@ -107,7 +195,7 @@ class SnowflakeClient:
         # Trim whitespace
         account = account.strip()
         
-        console.print(f"🔧 Normalized account: {account}")
+        self._log(f"🔧 Normalized account: {account}")
         return account
     
     def _load_private_key(self):
@@ -122,6 +210,7 @@ class SnowflakeClient:
                 raise ValueError(f"Invalid private key format in {key_path}. Expected .p8 file.")
             
             # Load the private key using cryptography
+            from cryptography.hazmat.primitives import serialization
             private_key = serialization.load_pem_private_key(
                 private_key_content.encode('utf-8'),
                 password=self.config.get('private_key_passphrase', None)
@@ -134,15 +223,14 @@ class SnowflakeClient:
     def _test_connection(self):
         """Test connection with a simple query."""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT CURRENT_VERSION()")
-            version = cursor.fetchone()[0]
-            console.print(f"📊 Snowflake version: {version}")
-            cursor.close()
+            with closing(self.connection.cursor()) as cursor:
+                cursor.execute("SELECT CURRENT_VERSION()")
+                version = cursor.fetchone()[0]
+            self._log(f"📊 Snowflake version: {version}")
         except Exception as e:
-            console.print(f"⚠️  Connection test failed: {e}")
+            self._log(f"⚠️  Connection test failed: {e}")
     
-    def _is_connection_valid(self) -> bool:
+    def _is_connection_valid(self, ping: bool = True) -> bool:
         """Check if connection is still alive and not timed out."""
         if not self.is_connected or not self.connection:
             return False
@@ -152,99 +240,235 @@ class SnowflakeClient:
             time_since_activity = time.time() - self.last_activity
             timeout_seconds = self.connection_timeout * 60  # Convert minutes to seconds
             if time_since_activity > timeout_seconds:
-                console.print(f"⏰ Connection timed out after {self.connection_timeout} minutes of inactivity")
+                self._log(f"⏰ Connection timed out after {self.connection_timeout} minutes of inactivity")
                 self.is_connected = False
                 return False
         
         # Check if connection is still alive
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
+        if not ping or self._ping(self.connection):
             return True
-        except:
-            self.is_connected = False
-            return False
+        self.is_connected = False
+        return False
     
     def execute_query(self, query: str, fetch_all: bool = True) -> List[tuple]:
         """Execute SQL query and return results."""
-        # Check if connection is still alive and not timed out
-        if not self._is_connection_valid():
+        return self._execute_query(query, fetch_all)
+    
+    def _execute_query(self, query: str, fetch_all: bool = True, pooled: bool = False) -> List[tuple]:
+        """Execute SQL query on the primary session, or on a pooled one if pooled is set."""
+        # Check the connection hasn't timed out; client_session_keep_alive keeps the
+        # session itself alive, so a dead one surfaces as an execute error, not a ping
+        if not self._is_connection_valid(ping=False):
             raise ConnectionError("Connection expired or lost. Run 'winter connect' first.")
         
         try:
-            cursor = self.connection.cursor()
-            console.print(f"🔍 Executing query: {query[:50]}{'...' if len(query) > 50 else ''}")
-            
-            start_time = time.time()
-            cursor.execute(query)
-            
-            # Update last activity time
-            self.last_activity = time.time()
-            
-            if fetch_all:
-                results = cursor.fetchall()
-                execution_time = time.time() - start_time
-                console.print(f"✅ Query executed successfully in {execution_time:.2f}s")
-                console.print(f"📊 Rows returned: {len(results)}")
-                return results
-            else:
-                # Return cursor for streaming results
-                return cursor
+            with ExitStack() as checkout_stack:
+                connection = checkout_stack.enter_context(self._acquire(pooled))
+                cursor = connection.cursor()
+                checkout_stack.callback(cursor.close)
+                
+                start_time = time.time()
+                cursor.execute(query)
+                self._invalidate_metadata_cache(query)
+                
+                # Update last activity time
+                self.last_activity = time.time()
+                
+                if fetch_all:
+                    results = cursor.fetchall()
+                    execution_time = time.time() - start_time
+                    self._log(f"🔍 {self._query_preview(query)} ✅ {len(results)} rows in {execution_time:.2f}s")
+                    return results
+                else:
+                    # Return cursor for streaming results; the checkout is held until
+                    # the caller closes it, so the connection can't be pooled or pruned
+                    cursor.close = checkout_stack.pop_all().close
+                    execution_time = time.time() - start_time
+                    self._log(f"🔍 {self._query_preview(query)} ✅ executed in {execution_time:.2f}s")
+                    return cursor
                 
         except Exception as e:
-            console.print(f"❌ Query execution failed: {e}")
+            self._log(f"❌ Query execution failed: {e}")
             raise
     
     def execute_query_with_columns(self, query: str) -> Tuple[List[str], List[tuple]]:
         """Execute query and return columns and results."""
-        # Check if connection is still alive and not timed out
-        if not self._is_connection_valid():
+        # Check the connection hasn't timed out; client_session_keep_alive keeps the
+        # session itself alive, so a dead one surfaces as an execute error, not a ping
+        if not self._is_connection_valid(ping=False):
             raise ConnectionError("Connection expired or lost. Run 'winter connect' first.")
         
         try:
-            cursor = self.connection.cursor()
-            console.print(f"🔍 Executing query: {query[:50]}{'...' if len(query) > 50 else ''}")
-            
-            start_time = time.time()
-            cursor.execute(query)
-            
-            # Update last activity time
-            self.last_activity = time.time()
-            
-            # Get column names
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            
-            # Get results
-            results = cursor.fetchall()
-            execution_time = time.time() - start_time
-            
-            console.print(f"✅ Query executed successfully in {execution_time:.2f}s")
-            console.print(f"📊 Rows returned: {len(results)}")
-            
-            return columns, results
+            with ExitStack() as checkout_stack:
+                connection = checkout_stack.enter_context(self._acquire())
+                
+                # Key on the session the query would run on, so it resolves the same way
+                cache_key = self._metadata_cache_key(query, connection)
+                if cache_key is not None:
+                    cached = self._get_cached_metadata(cache_key)
+                    if cached is not None:
+                        # A cache hit is still activity, so the client isn't pruned as idle
+                        self.last_activity = time.time()
+                        return cached
+                
+                cursor = checkout_stack.enter_context(closing(connection.cursor()))
+                start_time = time.time()
+                cursor.execute(query)
+                self._invalidate_metadata_cache(query)
+                
+                # Update last activity time
+                self.last_activity = time.time()
+                
+                # Get column names
+                columns = list(map(itemgetter(0), cursor.description)) if cursor.description else []
+                
+                # Get results
+                results = cursor.fetchall()
+                execution_time = time.time() - start_time
+                
+                self._log(f"🔍 {self._query_preview(query)} ✅ {len(results)} rows in {execution_time:.2f}s")
+                
+                if cache_key is not None:
+                    self._store_cached_metadata(cache_key, columns, results)
+                
+                return columns, results
             
         except Exception as e:
-            console.print(f"❌ Query execution failed: {e}")
+            self._log(f"❌ Query execution failed: {e}")
             raise
     
+    def _metadata_cache_key(self, query: str, connection) -> Optional[tuple]:
+        """Return a cache key for object-listing queries in the connection's session context, else None."""
+        normalized = ' '.join(query.split())
+        if tuple(normalized.upper().rstrip(';').split(' ', 2)[:2]) not in METADATA_QUERY_PREFIXES:
+            return None
+        # Unqualified SHOW/DESCRIBE resolve against the session's database, schema and role
+        return (normalized, getattr(connection, 'database', None),
+                getattr(connection, 'schema', None), getattr(connection, 'role', None))
+    
+    def _invalidate_metadata_cache(self, query: str):
+        """Clear cached metadata after USE, SET, DDL or DML statements."""
+        words = query.split(None, 1)
+        if words and words[0].upper() in METADATA_INVALIDATING_PREFIXES:
+            self._clear_metadata_cache()
+    
+    def _clear_metadata_cache(self):
+        """Drop all cached metadata results."""
+        with self._metadata_cache_lock:
+            self._metadata_cache.clear()
+    
+    def _get_cached_metadata(self, cache_key: tuple) -> Optional[Tuple[List[str], List[tuple]]]:
+        """Get a cached metadata result if it is younger than the TTL."""
+        with self._metadata_cache_lock:
+            entry = self._metadata_cache.get(cache_key)
+            if entry is None:
+                return None
+            cached_at, columns, results = entry
+            if time.monotonic() - cached_at > METADATA_CACHE_TTL:
+                del self._metadata_cache[cache_key]
+                return None
+            self._metadata_cache.move_to_end(cache_key)
+        # Hand out fresh lists so callers can't mutate the cached rows
+        return list(columns), list(results)
+    
+    def _store_cached_metadata(self, cache_key: tuple, columns: List[str], results: List[tuple]):
+        """Cache a metadata result, evicting the least recently used entry."""
+        with self._metadata_cache_lock:
+            self._metadata_cache[cache_key] = (time.monotonic(), tuple(columns), tuple(results))
+            self._metadata_cache.move_to_end(cache_key)
+            while len(self._metadata_cache) > METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+    
+    @contextmanager
+    def _acquire(self, use_pool: bool = False):
+        """Check out the primary connection, or an idle pooled one if use_pool is set."""
+        with self._pool_lock:
+            pooled = self.connection_pool.pop() if use_pool and self.connection_pool else None
+            self._active_checkouts += 1
+        try:
+            yield pooled or self.connection
+        finally:
+            with self._pool_lock:
+                self._active_checkouts -= 1
+                if pooled is not None and self.is_connected:
+                    self.connection_pool.append(pooled)
+                    pooled = None
+            if pooled is not None:
+                # disconnect() ran while this session was checked out
+                self._close_pooled([pooled])
+    
+    async def warm_pool_async(self, size: Optional[int] = None) -> int:
+        """Open pooled connections concurrently so their handshakes overlap."""
+        target = min(size or self.min_pool_size, self.max_pool_size)
+        missing = target - len(self.connection_pool)
+        if missing <= 0:
+            return len(self.connection_pool)
+        
+        import asyncio
+        # Build params once, off the event loop, since they may prompt or read the key file
+        connection_params = await _run_in_thread(self._build_connection_params)
+        outcomes = await asyncio.gather(*[
+            _run_in_thread(self._open_connection, connection_params)
+            for _ in range(missing)
+        ], return_exceptions=True)
+        
+        # Keep every handshake that succeeded so none is left open outside the pool
+        connections = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        with self._pool_lock:
+            if self.is_connected:
+                self.connection_pool.extend(connections)
+                connections = []
+        # disconnect() ran during the handshakes, so don't pool sessions it can't close
+        self._close_pooled(connections)
+        self._log(f"🏊 Connection pool warmed: {len(self.connection_pool)}/{self.max_pool_size} connections")
+        
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return len(self.connection_pool)
+    
+    def _get_query_semaphore(self) -> "asyncio.Semaphore":
+        """Get the semaphore bounding concurrent queries for the running loop."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._query_semaphore is None or self._query_semaphore_loop is not loop:
+            self._query_semaphore = asyncio.Semaphore(self.max_pool_size)
+            self._query_semaphore_loop = loop
+        return self._query_semaphore
+    
+    async def execute_query_async(self, query: str) -> List[tuple]:
+        """
+        Execute SQL query in a worker thread, at most max_pool_size at a time.
+        
+        Queries run on pooled sessions when available. Pooled sessions are separate
+        Snowflake sessions: they start from the configured database, schema and role
+        and don't see USE statements, session variables, temp tables or transactions
+        from the primary session. Use execute_query for anything session-dependent.
+        """
+        if not self._pool_warmed and self.min_pool_size and self.is_connected:
+            self._pool_warmed = True  # Set before awaiting so concurrent calls don't warm too
+            try:
+                await self.warm_pool_async()
+            except Exception as e:
+                self._pool_warmed = False  # Retry on the next call
+                logger.debug(f"Connection pool warmup failed: {e}")
+        
+        async with self._get_query_semaphore():
+            return await _run_in_thread(self._execute_query, query, pooled=True)
+    
     def get_connection_info(self) -> Dict[str, Any]:
         """Get current connection information."""
         if not self.is_connected or not self.connection:
             return {"status": "disconnected"}
         
         try:
-            cursor = self.connection.cursor()
-            
-            # Get connection details
-            cursor.execute("SELECT CURRENT_USER(), CURRENT_ROLE(), CURRENT_WAREHOUSE(), CURRENT_DATABASE(), CURRENT_SCHEMA()")
-            user, role, warehouse, database, schema = cursor.fetchone()
-            
-            cursor.execute("SELECT CURRENT_VERSION()")
-            version = cursor.fetchone()[0]
-            
-            cursor.close()
+            with closing(self.connection.cursor()) as cursor:
+                # Get connection details
+                cursor.execute("SELECT CURRENT_USER(), CURRENT_ROLE(), CURRENT_WAREHOUSE(), CURRENT_DATABASE(), CURRENT_SCHEMA()")
+                user, role, warehouse, database, schema = cursor.fetchone()
+                
+                cursor.execute("SELECT CURRENT_VERSION()")
+                version = cursor.fetchone()[0]
             
             return {
                 "status": "connected",
@@ -264,31 +488,47 @@ class SnowflakeClient:
         if self.connection:
             try:
                 self.connection.close()
-                console.print("🔌 Disconnected from Snowflake")
+                self._log("🔌 Disconnected from Snowflake")
             except Exception as e:
-                console.print(f"⚠️  Error during disconnect: {e}")
+                self._log(f"⚠️  Error during disconnect: {e}")
             finally:
                 self.connection = None
                 self.is_connected = False
+        
+        self._clear_metadata_cache()
+        
+        with self._pool_lock:
+            pooled, self.connection_pool = self.connection_pool, []
+            self._pool_warmed = False
+        self._close_pooled(pooled)
+    
+    def _close_pooled(self, connections: List[Any]):
+        """Close pooled connections, logging rather than raising on errors."""
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled connection: {e}")
     
     def is_connection_alive(self) -> bool:
         """Check if connection is still alive."""
         if not self.is_connected or not self.connection:
             return False
         
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
+        if self._ping(self.connection):
             return True
-        except:
-            self.is_connected = False
+        self.is_connected = False
+        return False
+    
+    def is_idle(self, idle_seconds: float) -> bool:
+        """Check if the client is connected with no queries in flight for idle_seconds."""
+        if not self.is_connected or self._active_checkouts:
             return False
+        return self.last_activity is None or time.time() - self.last_activity > idle_seconds
     
     def reconnect(self):
         """Reconnect to Snowflake."""
-        console.print("🔄 Reconnecting to Snowflake...")
+        self._log("🔄 Reconnecting to Snowflake...")
         self.disconnect()
         return self.connect()
 
@@ -296,21 +536,46 @@ class SnowflakeClient:
 class ConnectionManager:
     """Manage multiple Snowflake connections."""
     
-    def __init__(self):
-        self.connections = {}
+    def __init__(self, prune_interval: int = 60, idle_threshold: int = 300):
+        self.connections = OrderedDict()  # Least recently used first
         self.current_connection = None
+        self.idle_threshold = idle_threshold  # Seconds without activity before a client is closed
+        self._prune_interval_ns = prune_interval * 1_000_000_000
+        self._last_prune_ns = 0
+        self._prune_lock = threading.Lock()
     
     def add_connection(self, name: str, config: Dict[str, Any]) -> SnowflakeClient:
         """Add a new connection."""
-        client = SnowflakeClient(config)
+        client = SnowflakeClient(config, quiet=True)
         self.connections[name] = client
         return client
     
     def get_connection(self, name: str = None) -> Optional[SnowflakeClient]:
         """Get connection by name or current connection."""
         if name:
-            return self.connections.get(name)
-        return self.current_connection
+            client = self.connections.get(name)
+            if client is not None:
+                self.connections.move_to_end(name)
+        else:
+            client = self.current_connection
+        
+        if time.monotonic_ns() - self._last_prune_ns > self._prune_interval_ns:
+            self._prune_idle_connections(hot_client=client)
+        return client
+    
+    def _prune_idle_connections(self, hot_client: Optional[SnowflakeClient] = None):
+        """Disconnect idle clients, keeping the one just used and the current one."""
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another thread is already pruning
+        try:
+            self._last_prune_ns = time.monotonic_ns()
+            for client in list(self.connections.values()):
+                if client is hot_client or client is self.current_connection:
+                    continue
+                if client.is_idle(self.idle_threshold):
+                    client.disconnect()
+        finally:
+            self._prune_lock.release()
     
     def set_current_connection(self, name: str):
         """Set current active connection."""
@@ -319,6 +584,16 @@ class ConnectionManager:
         else:
             raise ValueError(f"Connection '{name}' not found")
     
+    async def execute_queries_async(self, queries: Dict[str, str]) -> Dict[str, List[tuple]]:
+        """Run one query per named connection concurrently."""
+        import asyncio
+        names = list(queries)
+        results = await asyncio.gather(*[
+            self.connections[name].execute_query_async(queries[name])
+            for name in names
+        ])
+        return dict(zip(names, results))
+    
     def list_connections(self) -> List[str]:
         """List all available connections."""
         return list(self.connections.keys())
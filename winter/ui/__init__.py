@@ -4,28 +4,121 @@ UI components for table display and scrolling.
 
 from rich.console import Console
 from rich.table import Table
-from rich.live import Live
 from rich.panel import Panel
-from rich.text import Text
-from typing import List, Any, Tuple
-import time
+from typing import List, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+import copy
+import io
+import os
+import select
+import sys
+try:
+    import termios
+    import tty
+except ImportError:
+    # Not available on Windows, where key readers fall back to line input
+    termios = tty = None
 # Removed pyperclip and threading imports - not needed for basic table viewing
 from winter.formatters import DataFormatter, ColumnAnalyzer
 from winter.header_formatter import create_smart_header_formatter
 
-# Try to import keyboard for arrow key support
-try:
-    import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
+# Number of rendered frames kept per result set by InteractiveTableViewer
+FRAME_CACHE_SIZE = 64
+
+# Text of the status panel below the table
+STATUS_TEMPLATE = "Rows: {}-{}/{} | Cols: {}-{}/{}"
+
+# Cell types whose equal values always format identically (unlike Decimal('1.0')
+# vs Decimal('1.00') or tz-aware datetimes), so formatted cells can be memoized
+CACHEABLE_CELL_TYPES = (str, int)
+
+# Cursor home + clear screen, used for full repaints
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Lines kept free below a frame for the cursor; a frame that doesn't leave
+# this room would scroll the screen and can't be diffed
+FRAME_MARGIN_LINES = 1
+
+# File descriptor of the terminal while _raw_mode() is active, else None
+_raw_fd = None
+_pending_input = b''  # Bytes read from the raw terminal but not consumed yet
+
+# Final byte of an arrow-key escape sequence (ESC [ x) -> direction
+ARROW_KEYS = {b'A': 'u', b'B': 'd', b'C': 'r', b'D': 'l'}
+
+# Seconds to wait for the rest of an escape sequence before treating ESC as a
+# lone keypress; terminals send a whole sequence at once, so this is only hit
+# when Esc itself was pressed
+ESCAPE_TIMEOUT = 0.05
+
+# Key -> viewer command. Arrow keys arrive from get_arrow_key already converted
+# to u/d/l/r; D pages down like the down arrow rather than scrolling right
+KEYMAP = {
+    'u': 'u', 'd': 'd', 'l': 'l', 'r': 'r',
+    'w': 'u', 'W': 'u', 's': 'd', 'S': 'd', 'a': 'l', 'A': 'l', 'D': 'd',
+    'q': 'q', 'Q': 'q', 'i': 'i', 'I': 'i', 'h': 'h', 'H': 'h', 'c': 'c', 'C': 'c',
+    ' ': 'space',
+}
+
+@contextmanager
+def _raw_mode(stream):
+    """Keep the terminal in raw input mode for a whole interactive session."""
+    global _raw_fd, _pending_input
+    if termios is None:
+        yield
+        return
+    
+    try:
+        fd = stream.fileno()
+        old_settings = termios.tcgetattr(fd)
+    except (OSError, ValueError, termios.error):
+        # Not a terminal; key readers fall back to per-call handling
+        yield
+        return
+    
+    tty.setraw(fd)
+    # Keep output post-processing so printed newlines still return the carriage
+    raw_settings = termios.tcgetattr(fd)
+    raw_settings[1] = old_settings[1]
+    termios.tcsetattr(fd, termios.TCSANOW, raw_settings)
+    _raw_fd = fd
+    try:
+        yield
+    finally:
+        _raw_fd = None
+        _pending_input = b''
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _read_raw(size: int) -> bytes:
+    """Read up to size bytes from the raw terminal, serving buffered input first."""
+    global _pending_input
+    # A single read picks up a whole escape sequence (or several queued keys)
+    data = _pending_input or os.read(_raw_fd, 8)
+    if not data:
+        raise EOFError
+    _pending_input = data[size:]
+    return data[:size]
+
+def _input_ready(timeout: float) -> bool:
+    """Check whether raw terminal input can be read within timeout seconds."""
+    if _pending_input:
+        return True
+    if _raw_fd is None:
+        return False
+    readable, _, _ = select.select([_raw_fd], [], [], timeout)
+    return bool(readable)
 
 # Simple single-character input without Enter
 def get_single_char():
     """Get a single character without requiring Enter."""
-    import sys
-    import tty
-    import termios
+    if _raw_fd is not None:
+        # Terminal is already raw for the session, so no mode switching per key
+        return _read_raw(1).decode('latin-1')
+    
+    if termios is None:
+        raise ImportError("termios is not available on this platform")
     
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
@@ -47,27 +140,35 @@ def get_user_input():
 def get_arrow_key():
     """Get arrow key input properly."""
     try:
-        # Try to get single character input
-        key = get_single_char()
-        
-        if key == '\x1b':  # ESC character (arrow keys)
-            # Read the next two characters to determine arrow key
-            key2 = get_single_char()
-            if key2 == '[':
-                key3 = get_single_char()
-                if key3 == 'A':  # Up arrow
-                    return 'u'
-                elif key3 == 'B':  # Down arrow
-                    return 'd'
-                elif key3 == 'C':  # Right arrow
-                    return 'r'
-                elif key3 == 'D':  # Left arrow
-                    return 'l'
-        
-        # Handle regular characters
-        if key.lower() in ['w', 'a', 's', 'd', 'q', 'i', 'h']:
-            return key.lower()
+        if _raw_fd is not None:
+            # Arrow keys arrive as ESC [ A-D, normally all in one read; a lone
+            # ESC has nothing behind it, so don't block waiting for more
+            key = _read_raw(1)
+            if key == b'\x1b':
+                if (_input_ready(ESCAPE_TIMEOUT) and _read_raw(1) == b'['
+                        and _input_ready(ESCAPE_TIMEOUT)):
+                    return ARROW_KEYS.get(_read_raw(1), '\x1b')
+                return '\x1b'
+            key = key.decode('latin-1')
+        else:
+            # Try to get single character input
+            key = get_single_char()
+            
+            if key == '\x1b':  # ESC character (arrow keys)
+                # Read the next two characters to determine arrow key
+                key2 = get_single_char()
+                if key2 == '[':
+                    key3 = get_single_char()
+                    if key3 == 'A':  # Up arrow
+                        return 'u'
+                    elif key3 == 'B':  # Down arrow
+                        return 'd'
+                    elif key3 == 'C':  # Right arrow
+                        return 'r'
+                    elif key3 == 'D':  # Left arrow
+                        return 'l'
         
+        # Regular characters are mapped, case included, through KEYMAP
         return key
     except:
         # Fallback to regular input
@@ -94,8 +195,9 @@ class TableViewer:
                 table.add_column(f"Column {i+1}")
         
         # Add rows
+        add_row = table.add_row
         for row in results:
-            table.add_row(*[str(cell) for cell in row])
+            add_row(*map(str, row))
         
         self.console.print(table)
     
@@ -117,6 +219,22 @@ class InteractiveTableViewer:
         self.analyzer = ColumnAnalyzer()
         self.header_formatter = create_smart_header_formatter()
         self.column_info = {}  # Store column analysis results
+        self._analysis_cache = {}  # column -> analysis for the results in _analysis_for
+        self._analysis_for = None  # (results, columns, row count) column_info was built for
+        self._frame_cache = OrderedDict()  # (scroll_x, scroll_y) -> rendered frame lines, LRU order
+        self._frame_cache_for = None  # (results, columns, width) the frame cache was built from
+        self._cached_format_cell = lru_cache(maxsize=4096)(self._format_cell_uncached)
+        self._headers = []  # Formatted header per column index
+        self._column_widths = []  # Display width per column index
+        self._headers_for = None  # columns list the headers were formatted from
+        self._col_type_by_idx = []  # Analyzed type per column index
+        self._formatted_rows = {}  # Row index -> formatted cells, filled as rows come into view
+        self._skeleton = None  # Table with headers only, rows are added to copies
+        self._skeleton_for = None  # (columns, scroll_x) the skeleton was built for
+        self._frame_lines = None  # Lines currently on screen, None forces a full repaint
+        self._frame_size = None  # (width, height) of the terminal when _frame_lines were drawn
+        self._status_message = None  # Feedback for the last key, shown with the next frame
+        self._render_console = None  # Off-screen console frames are rendered with
         
         # Store current data for basic functionality
         self.current_results = None
@@ -130,23 +248,17 @@ class InteractiveTableViewer:
         self.current_results = results
         self.current_columns = columns
         
-        # Limit data
-        display_results = results[:max_rows]
-        display_cols = columns[:max_cols]
+        # Pad ragged rows once so cells can be indexed without bounds checks
+        results = self._pad_rows(results, len(columns))
         
         try:
             # Analyze columns for formatting (analyze ALL columns, not just limited ones)
-            self.console.print("🔍 Analyzing column data types...")
-            self.column_info = {}
-            for i, col in enumerate(columns):  # Use full columns list
-                column_values = [row[i] for row in results if i < len(row)]
-                self.column_info[col] = self.analyzer.analyze_column(col, column_values)
+            self._analyze_columns(results, columns)
+            self._prepare_headers(columns)
         
             # Calculate total pages (use original counts, not limited counts)
             total_rows = len(results)  # Use original results count
             total_cols = len(columns)  # Use original columns count
-            max_row_page = max(0, total_rows - self.page_size)
-            max_col_page = max(0, total_cols - self.cols_per_page)
             
             # Show controls
             self.console.print("\n🎮 Interactive Table Controls:")
@@ -165,177 +277,357 @@ class InteractiveTableViewer:
                 self.console.print("   Use 'i' to see column information or 'q' to quit")
             
             # Interactive loop
-            while True:
-                # Create table with current scroll position
-                table = self._create_scrolled_table(results, columns)
-                
-                # Create status panel
-                status_text = f"Rows: {self.scroll_y+1}-{min(self.scroll_y+self.page_size, total_rows)}/{total_rows} | "
-                status_text += f"Cols: {self.scroll_x+1}-{min(self.scroll_x+self.cols_per_page, total_cols)}/{total_cols}"
-                
-                status_panel = Panel(
-                    status_text,
-                    title="Table Position",
-                    border_style="green"
-                )
-                
-                # Display everything
-                # Clear screen more reliably
-                import os
-                os.system('clear' if os.name == 'posix' else 'cls')
-                
-                self.console.print(table)
-                self.console.print(status_panel)
-                
-                # Get user input
-                try:
-                    self.console.print("\nPress arrow keys or WASD to navigate (or 'q' to quit, 'i' for info, 'h' for help):")
-                    key = get_arrow_key()
-                    
-                    # Handle input
-                    if key in ['u', 'd', 'l', 'r']:  # Arrow keys already converted
-                        user_input = key
-                    elif key.lower() in ['w', 'a', 's']:  # WASD keys (excluding 'd' for detail)
-                        if key.lower() == 'w':  # W = up
-                            user_input = 'u'
-                        elif key.lower() == 's':  # S = down
-                            user_input = 'd'
-                        elif key.lower() == 'a':  # A = left
-                            user_input = 'l'
-                    elif key.lower() == 'd':  # D = detail view (not navigation)
-                        user_input = 'd'
-                    elif key.lower() in ['q', 'i', 'h', 'c'] or key == ' ':
-                        user_input = key.lower() if key != ' ' else 'space'
-                    else:
-                        user_input = ''
-                except (EOFError, KeyboardInterrupt):
-                    self.console.print("\n⚠️  Interactive mode requires terminal input. Exiting...")
-                    break
-                
-                if user_input == 'q':
-                    break
-                elif user_input == 'l':
-                    # Check if we can scroll to previous columns
-                    if self.scroll_x > 0:
-                        self.scroll_x -= 1
-                        self.console.print("⬅️  Scrolled left")
-                    else:
-                        # At first columns, try previous page of data
-                        if self.scroll_y >= self.page_size:
-                            self.scroll_y -= self.page_size
-                            # Set to last columns if there are more columns
-                            if total_cols > self.cols_per_page:
-                                self.scroll_x = max(0, total_cols - self.cols_per_page)
-                            self.console.print("📄  Previous page of data")
-                        else:
-                            self.console.print("ℹ️  Already at the beginning of data")
-                elif user_input == 'r':
-                    # Check if we can scroll to more columns
-                    if self.scroll_x + self.cols_per_page < total_cols:
-                        self.scroll_x += 1
-                        self.console.print("➡️  Scrolled right")
-                    else:
-                        # No more columns, try pagination (next page of data)
-                        if self.scroll_y + self.page_size < total_rows:
-                            self.scroll_y += self.page_size
-                            self.scroll_x = 0  # Reset to first columns
-                            self.console.print("📄  Next page of data")
+            scroll_actions = {
+                'l': self._scroll_left,
+                'r': self._scroll_right,
+                'u': self._scroll_up,
+                'd': self._scroll_down,
+            }
+            # The prompt never changes, so render it once and draw it with each frame
+            prompt = "\nPress arrow keys or WASD to navigate (or 'q' to quit, 'i' for info, 'h' for help):"
+            prompt_lines = self._render_lines((prompt,))
+            
+            self._frame_lines = None
+            dirty = True
+            with _raw_mode(sys.stdin):
+                while True:
+                    # Redraw only when a key moved the view or left feedback, and only
+                    # once every queued key is handled, so a held key renders one frame
+                    if dirty and not _input_ready(0):
+                        if self._can_draw_raw():
+                            # Table and status panel for the current scroll position
+                            lines = self._get_frame_lines(results, columns, total_rows, total_cols)
+                            
+                            # Feedback for the last key goes on its own line under the status
+                            # panel, outside the cached frame, keeping the prompt in place
+                            lines = lines + [self._status_message or ""] + prompt_lines
+                            
+                            # Display everything, repainting only the lines that changed
+                            self._draw_frame(lines)
                         else:
-                            self.console.print("ℹ️  Already at the end of data")
-                elif user_input == 'u':
-                    # Check if we can scroll to previous rows
-                    if self.scroll_y >= self.page_size:
-                        self.scroll_y -= self.page_size
-                        self.console.print("📄  Previous page of data")
-                    elif self.scroll_y > 0:
-                        self.scroll_y = 0
-                        self.console.print("📄  First page of data")
+                            self._print_frame(results, columns, total_rows, total_cols, prompt)
+                        self._status_message = None
+                        dirty = False
+                    
+                    prev_scroll = (self.scroll_x, self.scroll_y)
+                    
+                    # Get user input
+                    try:
+                        key = get_arrow_key()
+                        
+                        # Handle input
+                        user_input = KEYMAP.get(key, '')
+                    except (EOFError, KeyboardInterrupt):
+                        self.console.print("\n⚠️  Interactive mode requires terminal input. Exiting...")
+                        break
+                    
+                    if user_input == 'q':
+                        break
+                    elif user_input in scroll_actions:
+                        scroll_actions[user_input](total_rows, total_cols)
+                    elif user_input == 'i':
+                        # Column info is limited to the first max_cols columns
+                        self._show_column_info(columns[:max_cols])
+                    elif user_input == 'h':
+                        self._show_help()
                     else:
-                        self.console.print("ℹ️  Already at the beginning of data")
-                elif user_input == 'd':
-                    # Check if we can go to next page
-                    if self.scroll_y + self.page_size < total_rows:
-                        self.scroll_y += self.page_size
-                        self.console.print("📄  Next page of data")
+                        self._set_status(f"❓ Unknown command: '{user_input}'. Use h for help.")
+                    
+                    if (self.scroll_x, self.scroll_y) != prev_scroll or self._status_message:
+                        dirty = True
                     else:
-                        self.console.print("ℹ️  Already at the end of data")
-                elif user_input == 'i':
-                    self._show_column_info(display_cols)
-                elif user_input == 'h':
-                    self._show_help()
-                else:
-                    self.console.print(f"❓ Unknown command: '{user_input}'. Use h for help.")
-                
+                        # Panels printed below the frame may have scrolled it
+                        self._frame_lines = None
+                    
         except KeyboardInterrupt:
             pass
         
         self.console.print("\n✅ Exited interactive table viewer")
     
-    def _create_scrolled_table(self, results: List[tuple], columns: List[str]) -> Table:
-        """Create table with current scroll position."""
-        table = Table(
-            show_header=True,
-            header_style="bold blue",
-            border_style="blue",
-            show_lines=True,
-            expand=True
-        )
+    def _set_status(self, message: str):
+        """Set the plain feedback line drawn with the next frame."""
+        self._status_message = message
+    
+    def _scroll_left(self, total_rows: int, total_cols: int):
+        """Scroll one column left, or to the previous page at the first columns."""
+        # Check if we can scroll to previous columns
+        if self.scroll_x > 0:
+            self.scroll_x -= 1
+            self._set_status("⬅️  Scrolled left")
+        else:
+            # At first columns, try previous page of data
+            if self.scroll_y >= self.page_size:
+                self.scroll_y -= self.page_size
+                # Set to last columns if there are more columns
+                if total_cols > self.cols_per_page:
+                    self.scroll_x = max(0, total_cols - self.cols_per_page)
+                self._set_status("📄  Previous page of data")
+            else:
+                self._set_status("ℹ️  Already at the beginning of data")
+    
+    def _scroll_right(self, total_rows: int, total_cols: int):
+        """Scroll one column right, or to the next page at the last columns."""
+        # Check if we can scroll to more columns
+        if self.scroll_x + self.cols_per_page < total_cols:
+            self.scroll_x += 1
+            self._set_status("➡️  Scrolled right")
+        else:
+            # No more columns, try pagination (next page of data)
+            if self.scroll_y + self.page_size < total_rows:
+                self.scroll_y += self.page_size
+                self.scroll_x = 0  # Reset to first columns
+                self._set_status("📄  Next page of data")
+            else:
+                self._set_status("ℹ️  Already at the end of data")
+    
+    def _scroll_up(self, total_rows: int, total_cols: int):
+        """Move to the previous page of rows."""
+        # Check if we can scroll to previous rows
+        if self.scroll_y >= self.page_size:
+            self.scroll_y -= self.page_size
+            self._set_status("📄  Previous page of data")
+        elif self.scroll_y > 0:
+            self.scroll_y = 0
+            self._set_status("📄  First page of data")
+        else:
+            self._set_status("ℹ️  Already at the beginning of data")
+    
+    def _scroll_down(self, total_rows: int, total_cols: int):
+        """Move to the next page of rows."""
+        # Check if we can go to next page
+        if self.scroll_y + self.page_size < total_rows:
+            self.scroll_y += self.page_size
+            self._set_status("📄  Next page of data")
+        else:
+            self._set_status("ℹ️  Already at the end of data")
+    
+    @staticmethod
+    def _pad_rows(results: List[tuple], width: int) -> List[tuple]:
+        """Pad rows shorter than width with None, returning results itself if none are."""
+        if all(len(row) >= width for row in results):
+            return results
+        return [row if len(row) >= width else tuple(row) + (None,) * (width - len(row))
+                for row in results]
+    
+    def _analyze_columns(self, results: List[tuple], columns: List[str]):
+        """Analyze all columns, reusing cached analysis for the same results."""
+        # Hold the results object itself so a recycled id() can't match stale analysis
+        analysis_for = (results, tuple(columns), len(results))
+        cached_for = self._analysis_for
+        same_results = (cached_for is not None and cached_for[0] is results
+                        and cached_for[2] == analysis_for[2])
+        if same_results and cached_for[1] == analysis_for[1]:
+            return
         
-        # Add visible columns
-        start_col = self.scroll_x
-        end_col = min(start_col + self.cols_per_page, len(columns))
+        if not same_results:
+            self._analysis_cache = {}
         
-        for i in range(start_col, end_col):
-            col_name = columns[i]
-            
-            # Get column info for formatting
-            col_info = self.column_info.get(col_name, {})
-            col_type = col_info.get('type', 'text')
-            
-            # Format header with smart scaling
-            formatted_headers = self.header_formatter.format_headers_smart([col_name], max_width=20)
-            display_header, full_header = formatted_headers[0]
+        missing = [(i, col) for i, col in enumerate(columns)
+                   if col not in self._analysis_cache]
+        if missing:
+            self.console.print("🔍 Analyzing column data types...")
             
-            # Use dynamic column width based on header length
-            header_length = len(col_name)
-            column_width = max(20, min(header_length + 2, 40))  # Dynamic width
+            # Transpose rows into per-column values in C; rows are padded to
+            # at least len(columns), so zip doesn't truncate any column
+            cols_vals = list(zip(*results))
+            cols_vals += [()] * (len(columns) - len(cols_vals))
             
-            table.add_column(
-                display_header,
-                overflow="fold",
-                min_width=column_width,  # Dynamic minimum width
-                max_width=column_width,  # Dynamic maximum width
-                no_wrap=False  # Allow wrapping for very long headers
+            first_cols = range(self.scroll_x, self.scroll_x + self.cols_per_page)
+            first_rows = slice(self.scroll_y, self.scroll_y + self.page_size)
+            for i, col in missing:
+                info = self.analyzer.analyze_column(col, cols_vals[i])
+                self._analysis_cache[col] = info
+                
+                # Format the first frame's cells while this column is at hand
+                if i in first_cols:
+                    col_type = info.get('type', 'text')
+                    for value in cols_vals[i][first_rows]:
+                        if type(value) in CACHEABLE_CELL_TYPES:
+                            self._cached_format_cell(value, col_type)
+        
+        self.column_info = {col: self._analysis_cache[col] for col in columns}
+        self._index_column_types(columns)
+        self._analysis_for = analysis_for
+    
+    def _index_column_types(self, columns: List[str]):
+        """Flatten column types into a list indexed by column position."""
+        self._col_type_by_idx = [self.column_info.get(col, {}).get('type', 'text') for col in columns]
+        # Formatted cells depend on the column types, so start a fresh matrix
+        self._formatted_rows = {}
+    
+    def _render_lines(self, renderables) -> List[str]:
+        """Render renderables off-screen into lines, matching the console's width and colors."""
+        console = self.console
+        render_console = self._render_console
+        if render_console is None or render_console.width != console.width:
+            render_console = Console(
+                file=io.StringIO(),
+                width=console.width,
+                force_terminal=console.is_terminal,
+                color_system=console.color_system,
+                legacy_windows=False
             )
+            self._render_console = render_console
+        
+        buffer = render_console.file
+        buffer.seek(0)
+        buffer.truncate()
+        for renderable in renderables:
+            render_console.print(renderable)
+        return buffer.getvalue().splitlines()
+    
+    def _can_draw_raw(self) -> bool:
+        """Check whether frames can be written as raw ANSI lines."""
+        # Legacy Windows consoles without VT support would show the escapes as text
+        return self.console.is_terminal and not self.console.legacy_windows
+    
+    def _print_frame(self, results: List[tuple], columns: List[str],
+                     total_rows: int, total_cols: int, prompt: str):
+        """Clear the screen and print the frame through Rich, for consoles without ANSI support."""
+        self.console.clear()
+        self.console.print(self._create_scrolled_table(results, columns))
+        self.console.print(self._create_status_panel(total_rows, total_cols))
+        self.console.print(self._status_message or "")
+        self.console.print(prompt)
+    
+    def _draw_frame(self, lines: List[str]):
+        """Draw rendered lines from the top of the screen, rewriting only changed ones."""
+        size = (self.console.width, self.console.height)
+        fits_screen = len(lines) + FRAME_MARGIN_LINES <= size[1]
+        previous = self._frame_lines
+        
+        # After a resize the terminal has reflowed what's on screen, so diffing against it is unsafe
+        if previous is None or not fits_screen or size != self._frame_size:
+            output = [CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            output = []
+            for row, line in enumerate(lines):
+                if row >= len(previous) or line != previous[row]:
+                    output.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+            # Park the cursor below the frame and clear the old prompt and messages
+            output.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        
+        self._frame_lines = lines if fits_screen else None
+        self._frame_size = size
+        self.console.file.write("".join(output))
+        self.console.file.flush()
+    
+    def _prepare_headers(self, columns: List[str]):
+        """Format all headers with smart scaling and size their columns once per columns list."""
+        if self._headers_for is columns:
+            return
+        formatted_headers = self.header_formatter.format_headers_smart(columns, max_width=20)
+        self._headers = [display_header for display_header, full_header in formatted_headers]
+        # Use dynamic column width based on header length
+        self._column_widths = [max(20, min(len(col) + 2, 40)) for col in columns]
+        self._headers_for = columns
+    
+    def _get_frame_lines(self, results: List[tuple], columns: List[str],
+                         total_rows: int, total_cols: int) -> List[str]:
+        """Get the rendered frame for the current scroll position, rendering it on a cache miss."""
+        cache_for = (results, columns, self.console.width)
+        cached_for = self._frame_cache_for
+        if (cached_for is None or cached_for[0] is not results
+                or cached_for[1] is not columns or cached_for[2] != cache_for[2]):
+            self._frame_cache.clear()
+            self._frame_cache_for = cache_for
+        
+        key = (self.scroll_x, self.scroll_y)
+        lines = self._frame_cache.get(key)
+        if lines is None:
+            table = self._create_scrolled_table(results, columns)
+            status_panel = self._create_status_panel(total_rows, total_cols)
+            lines = self._render_lines((table, status_panel))
+            self._frame_cache[key] = lines
+            if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        else:
+            self._frame_cache.move_to_end(key)
+        return lines
+    
+    def _create_status_panel(self, total_rows: int, total_cols: int) -> Panel:
+        """Create the panel showing the visible row and column range."""
+        status_text = STATUS_TEMPLATE.format(
+            self.scroll_y + 1, min(self.scroll_y + self.page_size, total_rows), total_rows,
+            self.scroll_x + 1, min(self.scroll_x + self.cols_per_page, total_cols), total_cols
+        )
+        return Panel(
+            status_text,
+            title="Table Position",
+            border_style="green"
+        )
+    
+    def _create_scrolled_table(self, results: List[tuple], columns: List[str]) -> Table:
+        """Create table with current scroll position."""
+        start_col = self.scroll_x
+        end_col = min(start_col + self.cols_per_page, len(columns))
+        table = self._copy_skeleton(columns, start_col, end_col)
         
         # Add visible rows
         start_row = self.scroll_y
         end_row = min(start_row + self.page_size, len(results))
         
+        formatted_rows = self._formatted_rows
         for i in range(start_row, end_row):
-            row = results[i]
-            formatted_row = []
+            formatted_row = formatted_rows.get(i)
+            if formatted_row is None:
+                formatted_row = formatted_rows[i] = self._format_row(results[i])
             
-            for j in range(start_col, end_col):
-                if j < len(row):
-                    cell = row[j]
-                    col_name = columns[j]
-                    col_info = self.column_info.get(col_name, {})
-                    col_type = col_info.get('type', 'text')
-                    
-                    # Format the cell value based on its type
-                    cell_value = self.formatter.format_value(cell, col_type, max_length=25)
-                else:
-                    cell_value = "[dim]NULL[/dim]"
-                formatted_row.append(cell_value)
+            table.add_row(*formatted_row[start_col:end_col])
+        
+        return table
+    
+    def _format_row(self, row: tuple) -> List[str]:
+        """Format every cell of a row based on its column type."""
+        format_cell = self._format_cell
+        return [format_cell(value, col_type) for value, col_type in zip(row, self._col_type_by_idx)]
+    
+    def _copy_skeleton(self, columns: List[str], start_col: int, end_col: int) -> Table:
+        """Return an empty table with the visible columns, reusing them across vertical scrolls."""
+        skeleton_for = self._skeleton_for
+        if skeleton_for is None or skeleton_for[0] is not columns or skeleton_for[1] != start_col:
+            skeleton = Table(
+                show_header=True,
+                header_style="bold blue",
+                border_style="blue",
+                show_lines=True,
+                expand=True
+            )
+            
+            for i in range(start_col, end_col):
+                column_width = self._column_widths[i]
+                skeleton.add_column(
+                    self._headers[i],
+                    overflow="fold",
+                    min_width=column_width,  # Dynamic minimum width
+                    max_width=column_width,  # Dynamic maximum width
+                    no_wrap=False  # Allow wrapping for very long headers
+                )
             
-            table.add_row(*formatted_row)
+            self._skeleton = skeleton
+            self._skeleton_for = (columns, start_col)
         
+        # Columns hold their cells, so every table gets its own empty copies
+        table = copy.copy(self._skeleton)
+        table.columns = [column.copy() for column in self._skeleton.columns]
+        table.rows = []
         return table
     
+    def _format_cell(self, value: Any, col_type: str) -> str:
+        """Format a cell value, memoizing values that are safe to key on."""
+        if type(value) in CACHEABLE_CELL_TYPES:
+            return self._cached_format_cell(value, col_type)
+        return self._format_cell_uncached(value, col_type)
+    
+    def _format_cell_uncached(self, value: Any, col_type: str) -> str:
+        """Format a cell value for the scrolled table."""
+        return self.formatter.format_value(value, col_type, max_length=25)
+    
     def _create_table_display(self, results: List[tuple], columns: List[str]):
         """Create initial table display."""
-        table = self._create_scrolled_table(results, columns)
+        self._prepare_headers(columns)
+        self._index_column_types(columns)
+        table = self._create_scrolled_table(self._pad_rows(results, len(columns)), columns)
         self.console.print(table)
     
     def _show_help(self):
@@ -2,10 +2,20 @@
 Utility functions for Winter.
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Prefer libyaml's C loader/dumper, falling back to pure Python without it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Resolved config path -> (st_mtime_ns, parsed YAML) from the last load
+_CONFIG_CACHE: Dict[str, Tuple[int, Any]] = {}
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -21,8 +31,16 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             f"Please create config file with: winter setup"
         )
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    # Reuse the parsed file while it is unchanged; callers get their own copy
+    cache_key = str(config_file.resolve())
+    mtime_ns = config_file.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        config = copy.deepcopy(cached[1])
+    else:
+        with open(config_file, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        _CONFIG_CACHE[cache_key] = (mtime_ns, copy.deepcopy(config))
     
     # Validate required fields
     required_fields = ['account', 'user', 'auth_method']
@@ -57,7 +75,10 @@ def save_config(config: Dict[str, Any], config_path: Optional[str] = None):
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
     with open(config_file, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False)
+    
+    # The mtime may not tick on coarse-grained filesystems, so drop the entry
+    _CONFIG_CACHE.pop(str(config_file.resolve()), None)
     
     # Set secure permissions
     os.chmod(config_file, 0o600)
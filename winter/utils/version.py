@@ -2,61 +2,165 @@
 Utility functions untuk menangani versi Winter.
 """
 
-import pkg_resources
-import os
+import functools
+import importlib
+import mmap
+import re
 from pathlib import Path
+from typing import Any, NamedTuple, Optional, Tuple
 
+# Modul TOML yang tersedia: None = belum dicari, False = tidak ada
+_TOMLLIB = None
 
+# pyproject.toml di root source checkout, dan apakah file itu ada
+_PYPROJECT_PATH = Path(__file__).resolve().parent.parent.parent / "pyproject.toml"
+_PYPROJECT_EXISTS = _PYPROJECT_PATH.is_file()
+
+# Ukuran minimum (byte) pyproject.toml yang di-scan lewat mmap
+_MMAP_MIN_SIZE = 64 * 1024
+
+# `version = "..."` di tabel [project], tanpa melewati header tabel berikutnya
+_VERSION_RE = re.compile(
+    rb'^\[project\][ \t]*\r?\n(?:(?!\[)[^\n]*\n)*?version\s*=\s*"([^"]+)"',
+    re.MULTILINE
+)
+
+
+def _get_tomllib():
+    """
+    Dapatkan modul tomllib (Python 3.11+) atau tomli (Python < 3.11).
+    Import hanya dicoba sekali, hasilnya disimpan di _TOMLLIB.
+    """
+    global _TOMLLIB
+    if _TOMLLIB is None:
+        _TOMLLIB = False
+        for name in ("tomllib", "tomli"):
+            try:
+                _TOMLLIB = importlib.import_module(name)
+                break
+            except ImportError:
+                continue
+    return _TOMLLIB
+
+
+@functools.lru_cache(maxsize=1)
+def _get_winter_dist():
+    """
+    Dapatkan distribution Winter yang terinstall, atau None jika belum terinstall.
+    Dipakai bersama oleh get_current_version dan get_package_info.
+    """
+    # Import di sini supaya jalur cepat lewat winter._version tidak membayar importlib.metadata
+    from importlib import metadata as importlib_metadata
+    
+    try:
+        return importlib_metadata.distribution("winter")
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_current_version():
     """
     Dapatkan versi saat ini dari package yang terinstall.
     Fallback ke pyproject.toml jika package belum terinstall.
     """
     try:
-        # Coba dapatkan dari package yang terinstall
-        return pkg_resources.get_distribution("winter").version
-    except pkg_resources.DistributionNotFound:
-        # Fallback ke pyproject.toml
-        try:
-            import tomllib  # Python 3.11+
-        except ImportError:
-            try:
-                import tomli as tomllib  # Python < 3.11
-            except ImportError:
-                # Jika tidak ada tomli, gunakan versi hardcoded
-                return "0.1.0"
-        
-        # Cari pyproject.toml dari direktori saat ini
-        current_dir = Path(__file__).parent.parent.parent
-        pyproject_path = current_dir / "pyproject.toml"
-        
-        if pyproject_path.exists():
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-                return data.get("project", {}).get("version", "0.1.0")
-        
-        # Fallback terakhir
+        # Versi yang ditulis ke package saat build (lihat setup.py)
+        from winter._version import __version__
+        return __version__
+    except ImportError:
+        pass
+    
+    # Coba dapatkan dari package yang terinstall
+    dist = _get_winter_dist()
+    if dist is not None:
+        return dist.version
+    
+    # Fallback ke pyproject.toml di root source checkout
+    if _PYPROJECT_EXISTS:
+        return _read_pyproject_version(_PYPROJECT_PATH, _PYPROJECT_PATH.stat().st_size)
+    
+    # Fallback terakhir
+    return "0.1.0"
+
+
+def _read_pyproject_version(pyproject_path, size):
+    """
+    Baca project.version dari pyproject.toml.
+    Coba regex dulu, parse TOML penuh hanya kalau regex tidak ketemu.
+    """
+    with open(pyproject_path, "rb") as f:
+        if size >= _MMAP_MIN_SIZE:
+            # File besar di-scan lewat mmap, tanpa menyalin isinya ke bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                match = _VERSION_RE.search(data)
+                version = match.group(1) if match else None
+        else:
+            match = _VERSION_RE.search(f.read())
+            version = match.group(1) if match else None
+    if version is not None:
+        return version.decode("utf-8")
+    
+    tomllib = _get_tomllib()
+    if not tomllib:
+        # Jika tidak ada tomli, gunakan versi hardcoded
         return "0.1.0"
+    with open(pyproject_path, "rb") as f:
+        return tomllib.load(f).get("project", {}).get("version", "0.1.0")
 
 
+@functools.lru_cache(maxsize=1)
+def _base_requires(dist):
+    """
+    Dapatkan dependency utama (tanpa extras) sebagai string requirement,
+    sama seperti hasil pkg_resources dulu, misalnya "rich>=13.0.0".
+    """
+    from packaging.requirements import Requirement
+    
+    requires = []
+    for line in dist.requires or ():
+        req = Requirement(line)
+        if req.marker is None or req.marker.evaluate({"extra": ""}):
+            requires.append(str(req))
+    return tuple(requires)
+
+
+class PackageInfo(NamedTuple):
+    """
+    Informasi package Winter (read-only).
+    Dependency (requires) baru dibaca dari metadata saat pertama diakses.
+    """
+    name: str
+    version: str
+    location: Optional[str]
+    installed: bool
+    dist: Any = None
+    
+    @property
+    def requires(self) -> Tuple[str, ...]:
+        if self.dist is None:
+            return ()
+        return _base_requires(self.dist)
+
+
+@functools.lru_cache(maxsize=1)
 def get_package_info():
     """
     Dapatkan informasi package Winter.
+    Hasilnya di-cache dan read-only, jadi caller tidak bisa mengubah cache.
     """
-    try:
-        dist = pkg_resources.get_distribution("winter")
-        return {
-            "name": dist.project_name,
-            "version": dist.version,
-            "location": dist.location,
-            "requires": [str(req) for req in dist.requires()],
-            "installed": True
-        }
-    except pkg_resources.DistributionNotFound:
-        return {
-            "name": "winter",
-            "version": get_current_version(),
-            "location": None,
-            "requires": [],
-            "installed": False
-        }
+    dist = _get_winter_dist()
+    if dist is not None:
+        return PackageInfo(
+            name=dist.metadata["Name"],
+            version=dist.version,
+            location=str(dist.locate_file("")),
+            installed=True,
+            dist=dist
+        )
+    return PackageInfo(
+        name="winter",
+        version=get_current_version(),
+        location=None,
+        installed=False
+    )